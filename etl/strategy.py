@@ -1,21 +1,37 @@
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from google.cloud import bigquery
 from google.oauth2 import service_account
-import json
 import logging
 from math import ceil
-import numpy as np
+import orjson
 import os
 import pandas as pd
-from random import randint
+from random import choice, randint
 import re
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 import sys
 from fake_useragent import UserAgent
 from time import sleep
+from urllib3.util.retry import Retry
+
+
+MAX_WORKERS = 8 # concurrent page fetches
+POOL_SIZE = 16 # keep-alive connections held by the session
+REQUEST_TIMEOUT = 10 # seconds
+HTTP_CACHE_EXPIRE = 3600 # seconds, only used when ETL_HTTP_CACHE is set
+LOAD_CHUNK_ROWS = 50_000 # max rows sent to BigQuery in one load job
+UA_SAMPLE_SIZE = 50 # user agents drawn once per ETL object
+
+# Columns set for every listing, dynamic parameters are added after them
+STATIC_COLS = ('scrape_date', 'created_date', 'title', 'short_description', 'price', 'currency', 'cepik_verified')
+
+_EMPTY = {} # shared read-only default for missing nested JSON objects
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
 
 
 class Logger:
@@ -82,6 +98,36 @@ class OtoMotoETL(ETLStrategy):
         self.client = bigquery.Client(credentials=credentials, project=project_id)
         self.table_ref = f"{project_id}.{dataset_id}.{table_id}"
 
+        # Shared HTTP session, keeps connections alive between page fetches.
+        # Set ETL_HTTP_CACHE to cache responses on disk when re-running during development
+        if os.getenv('ETL_HTTP_CACHE'):
+            self.session = requests_cache.CachedSession(
+                cache_name='otomoto_cache',
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRE
+            )
+        else:
+            self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504], # rate limiting and transient server errors
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # User-Agent database is loaded and sampled once, _get_headers only picks from the sample
+        try:
+            ua = UserAgent(platforms=['desktop', 'mobile'])
+            self._user_agents = [ua.random for _ in range(UA_SAMPLE_SIZE)]
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate a random User-Agent: {e}")
+
     def _get_url(self, brand, model, page=1) -> str:
         '''
         Return url in 4th diffrent configurations.
@@ -113,124 +159,163 @@ class OtoMotoETL(ETLStrategy):
         Check "Custom Headers"-> https://requests.readthedocs.io/en/latest/user/quickstart/ 
         :return headers: dictionary with configurations
         '''
-        try:
-            ua = UserAgent(platforms=['desktop', 'mobile'])
-            user_agent = ua.random
-        except Exception as e:
-            raise RuntimeError(f"Failed to generate a random User-Agent: {e}")
-                
         headers = {
-            'User-Agent': user_agent,
+            'User-Agent': choice(self._user_agents),
         }
         return headers
 
-    def _get_soup(self, url, headers) -> BeautifulSoup:
+    def _get_page(self, url) -> bytes:
         """
-        Fetches the HTML content from the given URL and parses it using BeautifulSoup.
+        Fetches the raw HTML content from the given URL. Headers are taken from self.session.
         :param url: str, the URL to fetch.
-        :param headers: dict, the headers to include in the request.
-        :return: BeautifulSoup, parsed HTML content if successful, otherwise None.
+        :return: bytes with the response body if successful, otherwise None.
         """
         # Send a GET request to the URL
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code != 200:
             self.logger.info(f"Failed to fetch page: {response.status_code}")
             return None
         
-        # Parse the HTML content using BeautifulSoup
-        return BeautifulSoup(response.content, 'html.parser')
+        return response.content
+
+    def _get_next_data(self, content) -> bytes:
+        """
+        Returns the raw bytes of the __NEXT_DATA__ script of the fetched page.
+        The script is located with a regex over the raw body, no HTML tree or decoded str is built.
+        :param content: bytes with the listing page.
+        :return: bytes with the JSON payload, or None if the script tag is missing.
+        """
+        match = _NEXT_DATA_RE.search(content)
+        if not match:
+            return None
+        return match.group(1)
 
-    def _get_data_with_key(self, json_object, key) -> dict:
+    def _get_data_with_key(self, urql_state, key) -> dict:
         '''
-        Json_object parser, depends of key.
+        urqlState parser, depends of key.
         '''
         try:
-            # Access nested JSON structure
-            urql_state = json_object.get('props', {}).get('pageProps', {}).get('urqlState', {})
-            
             if key not in urql_state:
                 raise KeyError(f"Key '{key}' not found in 'urqlState'.")
 
-            # Parse the JSON data associated with the key
-            data_json = json.loads(urql_state[key]['data'])
+            # Parse the JSON data associated with the key. orjson raises JSONDecodeError (a ValueError)
+            # for non-string input where json raised TypeError, keep that a KeyError so the caller falls back
+            data = urql_state[key]['data']
+            if not isinstance(data, (str, bytes)):
+                raise KeyError(f"'data' under key '{key}' is {type(data).__name__}, not a JSON string.")
+            data_json = orjson.loads(data)
+            if not isinstance(data_json, dict):
+                raise KeyError(f"'data' under key '{key}' is not a JSON object.")
             
-            # Extract the required 'advertSearch' edges
-            final_data = data_json.get('advertSearch', {}).get('edges', [])
-            return final_data
+            # Extract the required 'advertSearch' node (edges, totalCount, pageInfo), JSON null counts as missing
+            return data_json.get('advertSearch') or {}
 
         except (KeyError, TypeError) as e:
             # Handle missing keys or unexpected JSON structure
             raise KeyError(f"Error accessing data with key '{key}': {e}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             # Handle JSON decoding errors
             raise ValueError(f"Error decoding JSON data for key '{key}': {e}")
 
-    def _create_row_from_dict(self, input_dict) -> dict:
+    def _create_row_from_dict(self, input_dict, scrape_date) -> dict:
         """
         Transforms an input dictionary into a structured row dictionary.
         :param input_dict: input data (dict) containing a 'node' key with relevant details.
+        :param scrape_date: str, date of the run formatted once by the caller (%Y-%m-%d).
         :return row, creation_date: a flattened dictionary with extracted and mapped fields and just a creation date.
         """
         try:
-            node_dict = input_dict.get('node', {})
-            row = {}
-
-            # Metadata - scrape data and creating advertisement
-            row['scrape_date'] = datetime.now().strftime("%Y-%m-%d")
-            created_date = node_dict.get('createdAt', "1900-01-01")
-            row['created_date'] = datetime.strptime(created_date[0:10], "%Y-%m-%d")
-
-            # Title and description
-            row['title'] = node_dict.get('title', "")
-            row['short_description'] = node_dict.get('shortDescription', "")
-
-            # Price and currency
-            price_info = node_dict.get('price', {}).get('amount', {})
-            row['price'] = price_info.get('units', 0)
-            row['currency'] = price_info.get('currencyCode', "UNKNOWN")
-
-            # Cepik verification
-            row['cepik_verified'] = node_dict.get('cepikVerified', False)
-
-            # Dynamic parameters
-            parameters = node_dict.get('parameters', [])
-            for param in parameters:
-                key = param.get('key')
-                value = param.get('value')
-                if key:  # Only add valid keys
-                    row[key] = value
+            node_dict = input_dict.get('node', _EMPTY)
+            get = node_dict.get
+
+            # createdAt is ISO 8601, fromisoformat is a C fast path compared to strptime
+            created_date = datetime.fromisoformat(get('createdAt', "1900-01-01")[:10])
+
+            price_info = get('price', _EMPTY).get('amount', _EMPTY)
+            currency = price_info.get('currencyCode', "UNKNOWN")
+
+            row = {
+                # Metadata - scrape data and creating advertisement
+                'scrape_date': scrape_date,
+                'created_date': created_date,
+                # Title and description
+                'title': get('title', ""),
+                'short_description': get('shortDescription', ""),
+                # Price and currency, few distinct currencies repeated over every listing, share one str object
+                'price': price_info.get('units', 0),
+                'currency': sys.intern(currency) if isinstance(currency, str) else currency,
+                # Cepik verification
+                'cepik_verified': get('cepikVerified', False),
+                # Dynamic parameters, only valid keys
+                **{sys.intern(param['key']): param.get('value')
+                   for param in get('parameters', ()) if param.get('key')},
+            }
 
-            return row, row['created_date']
+            return row, created_date
 
         except Exception as e:
             # Log the error or handle it appropriately
             self.logger.error(f"Error processing input_dict: {e}")
             return {}
 
-    def _create_df_from_row(self, df, row) -> pd.DataFrame:
+    def _get_advert_search(self, json_object) -> dict:
         '''
-        Add a new row to DataFrame. If DataFrame doesnt exist create it.
-        :param df: input DataFrame or None
-        :param row: a flattened dictionary with extracted and mapped fields
-        :return: DataFrame with added row.
+        Return the 'advertSearch' node of a parsed __NEXT_DATA__ object.
+        The search query is stored under the last urqlState key, the first one is tried as a fallback.
+        :param json_object: dict, parsed __NEXT_DATA__
+        :return: dict with 'edges', 'totalCount' and 'pageInfo', empty if no car data was found.
         '''
-        # Create a new DataFrame or append to the existing one
-        if df is None:
-            return pd.DataFrame([row])
-        
-        return pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+        # JSON nulls anywhere on the path count as missing data
+        props = json_object.get('props') if isinstance(json_object, dict) else None
+        urql_state = ((props or {}).get('pageProps') or {}).get('urqlState')
+        if not urql_state or not isinstance(urql_state, dict):
+            self.logger.warning("No car data in here :(")
+            return {}
+
+        # dicts are ordered, take both ends without materializing the keys
+        # (keys hash the query variables, page included, so they can't be reused across pages)
+        last_key = next(reversed(urql_state))
+        first_key = next(iter(urql_state))
+
+        try:
+            return self._get_data_with_key(urql_state, last_key)
+        except KeyError:
+            try:
+                return self._get_data_with_key(urql_state, first_key)
+            except (KeyError, ValueError):
+                self.logger.warning("No car data in here :(")
+        return {}
 
-    def _find_page_num(self, text:str) -> int:
+    def _find_page_num(self, advert_search:dict) -> int:
         """
-        Extracts the number of ads from the given text. Raises ValueError if not found.
+        Extracts the number of pages from the 'advertSearch' node. Raises ValueError if not found.
         """
-        match = re.search(r'Liczba ogłoszeń:\s*<!--\s*-->\s*<b>([\d\s]+)</b>', text)
-        if not match:
-            raise ValueError("Could not find the number of ads in the given text.")
-        
-        ad_num = int(match.group(1).replace(" ", ""))  # Remove spaces and convert to int
-        return ceil(ad_num/32) # 32 ads on page
+        ad_num = advert_search.get('totalCount')
+        if ad_num is None:
+            raise ValueError("Could not find the number of ads in the given data.")
+
+        page_size = (advert_search.get('pageInfo') or {}).get('pageSize') or 32 # 32 ads on page
+        return ceil(ad_num/page_size)
+
+    def _append_row(self, columns, row, n_rows):
+        '''
+        Append a flattened row to the column-oriented buffer used to build the DataFrame.
+        Columns first seen in this row are backfilled with None for the previous rows,
+        columns missing from this row get None.
+        :param columns: dict of lists, column name -> values
+        :param row: a flattened dictionary with extracted and mapped fields
+        :param n_rows: int, number of rows already in columns
+        '''
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * n_rows
+            column.append(value)
+
+        for column in columns.values():
+            if len(column) == n_rows:
+                column.append(None)
 
     def _is_stop_date_greater_than_creation_date(self, creation_date:datetime, stop_date:datetime) -> bool:
         return stop_date > creation_date
@@ -270,9 +355,11 @@ class OtoMotoETL(ETLStrategy):
 
         actual_columns = df.columns.tolist()
 
-        # Check if all expected columns are present
-        missing_columns = [col for col in expected_columns if col not in actual_columns]
-        extra_columns = [col for col in actual_columns if col not in expected_columns]
+        # Check if all expected columns are present, membership tests against sets keep input order
+        expected_set = set(expected_columns)
+        actual_set = set(actual_columns)
+        missing_columns = [col for col in expected_columns if col not in actual_set]
+        extra_columns = [col for col in actual_columns if col not in expected_set]
         
         # Check if columns are in the correct order
         correct_order = actual_columns == expected_columns
@@ -283,87 +370,132 @@ class OtoMotoETL(ETLStrategy):
             "correct_order": correct_order
         }
 
-    def extarct(self, **kwargs):
-        # Code to scrape data from otomoto.pl
+    def _extract_page(self, brand, model, page_num, delay_scraping) -> list:
+        '''
+        Fetch a single listing page and return its advert edges. Runs in a worker thread.
+        :param brand: string with name of a car brand e.g. Opel
+        :param model: string with model of the car e.g. Astra
+        :param page_num: int, page to fetch
+        :param delay_scraping: bool, if true sleep randint(1,5) before the request
+        :return: list of edges, or None if __NEXT_DATA__ was not found on the page.
+        '''
+        self.logger.info(f"Extracting data of: {brand.title()} {model.title()}. Page number: {page_num}")
+
+        # Pretend human
+        if delay_scraping:
+            sleep(randint(1,5))
+
+        url = self._get_url(brand, model, page=page_num)
+        content = self._get_page(url)
+        if content is None:
+            raise ValueError(f"Failed to fetch page {page_num}.")
+
+        # Find all car listings
+        listings = self._get_next_data(content)
+        if not listings:
+            return None
+
+        # Extract data from listing
+        json_object = orjson.loads(listings)
+
+        return self._get_advert_search(json_object).get('edges') or []
 
+    def iter_rows(self, **kwargs):
+        '''
+        Generator of flattened rows scraped from otomoto.pl.
+        Pages are fetched concurrently and their rows are yielded in page order as soon as each page is ready.
+        Sets self._forced_stop when the days_ago cut-off ended the extraction.
+        **kwargs: same as extarct
+        '''
         # external params (created at context menager)
         brand = kwargs.get('brand', '')
         model = kwargs.get('model', '')
         days_ago = kwargs.get('days_ago', -1)
         delay_scraping = kwargs.get('delay_scraping', False)
+        max_workers = kwargs.get('max_workers', MAX_WORKERS)
 
         # internal params (created in run_etl)
         page_num_start = kwargs['page_num_start'] # include
         page_num_stop = kwargs['page_num_stop'] # include
-        headers = kwargs['headers']
-
-        # decide if get all data or limited by date
-        forced_stop = False
-        stop_date=None
-        if days_ago>=0:
-            stop_date = self._n_days_ago(days_ago)
 
         # decide if get all data or limited by date
+        self._forced_stop = False
         stop_date=None
         if days_ago>=0:
             stop_date = self._n_days_ago(days_ago)
 
         # Prepare prerequisits
-        headers = self._get_headers()
-        url = self._get_url(brand, model)
-        df = None
-
-        # Get init soup and number of pages
-        soup = self._get_soup(url, headers)
-
-        # Loop through pages
-        for page_num in range(page_num_start, page_num_stop+1):
-            try:
-                self.logger.info(f"Extracting data of: {brand.title()} {model.title()}. Page number: {page_num}")
-
-                # Pretend human
-                if delay_scraping:
-                    sleep(randint(1,5))
+        self.session.headers.update(self._get_headers())
+        scrape_date = datetime.now().strftime("%Y-%m-%d") # same for every row of the run
 
-                url = self._get_url(brand, model, page=page_num)
-                soup = self._get_soup(url, headers)
+        # Fetch pages concurrently, with a single worker when pretending human
+        if delay_scraping:
+            max_workers = 1
+        page_nums = range(page_num_start, page_num_stop+1)
 
-                # Find all car listings
-                listings = soup.find(id='__NEXT_DATA__')
+        # Managed by hand, not with `with`: its __exit__ would block on every in-flight fetch
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(self._extract_page, brand, model, page_num, delay_scraping)
+                for page_num in page_nums]
 
-                # Check if listings were found
-                if not listings:
-                    self.logger.info("No car listings found. The website structure may have changed.")
+            # Consume results in page order, so stop_date still cuts off at the right listing
+            for page_num, future in zip(page_nums, futures):
+                try:
+                    final_data = future.result()
+
+                    # Check if listings were found
+                    if final_data is None:
+                        self.logger.info("No car listings found. The website structure may have changed.")
+                        return
+
+                    page_rows = []
+                    for input_data in final_data:
+                        row, creation_date = self._create_row_from_dict(input_data, scrape_date)
+                        # Stop for-loop if stop_date>creation_date
+                        if stop_date:
+                            if self._is_stop_date_greater_than_creation_date(creation_date, stop_date):
+                                self._forced_stop = True
+                                break
+
+                        page_rows.append(row)
+                except (requests.RequestException, ValueError, KeyError) as e:
+                    self.logger.warning(f"Extracting of page {page_num} failed: {e}")
+                    continue
+
+                yield from page_rows
+                if self._forced_stop:
                     return
-                
-                # Extract data from listing
-                json_object = json.loads(str(listings.text))
-
-                last_key = list(json_object.get('props', {}).get('pageProps', {}).get('urqlState', {}).keys())[-1]
-                first_key = list(json_object.get('props', {}).get('pageProps', {}).get('urqlState', {}).keys())[0]
+        finally:
+            # Cancel queued pages and return without joining in-flight ones (forced stop or consumer
+            # closed the generator), their results are discarded when the fetch finishes
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                try:
-                    final_data = self._get_data_with_key(json_object, last_key)
-                except KeyError:
-                    try:
-                        final_data = self._get_data_with_key(json_object, first_key)
-                    except:
-                        self.logger.warning("No car data in here :(")
-
-                # Save extracted data to df
-                for input_data in final_data:
-                    row, creation_date = self._create_row_from_dict(input_data)
-                    # Stop for-loop if stop_date>creation_date
-                    if stop_date:
-                        if self._is_stop_date_greater_than_creation_date(creation_date, stop_date):
-                            forced_stop = True
-                            return df, forced_stop
-
-                    df = self._create_df_from_row(df, row)
-            except:
-                self.logger.info(f"Extracting of page {page_num} failed.")
-                continue
-        return df, forced_stop
+    def extarct(self, **kwargs):
+        # Code to scrape data from otomoto.pl
+        '''
+        Extract rows from iter_rows into a DataFrame.
+        **kwargs:
+            'brand': str, e.g. opel
+            'model': str, e.g. astra
+            'days_ago: int, how many days before wants to scrape
+            'delay_scraping': bool, if true delay scraping every page by sleep(randint(1,5))
+            'max_workers': int, number of pages fetched concurrently, default MAX_WORKERS
+            'page_num_start': int, first page (included)
+            'page_num_stop': int, last page (included)
+        :return df, forced_stop: extracted DataFrame (None if no rows) and True if the days_ago cut-off was reached.
+        '''
+        # Collect rows column-wise, DataFrame is built once at the end
+        columns = {col: [] for col in STATIC_COLS}
+        n_rows = 0
+        for row in self.iter_rows(**kwargs):
+            self._append_row(columns, row, n_rows)
+            n_rows += 1
+
+        if n_rows == 0:
+            return None, self._forced_stop
+        return pd.DataFrame(columns), self._forced_stop
     
     def transform(self, df: pd.DataFrame):
         # code to tranform data compliant schema
@@ -375,11 +507,24 @@ class OtoMotoETL(ETLStrategy):
         '''
         self.logger.info(f"Transforming data.")
 
-        # REMOVE space FROM STR LOOKLIKE INT
-        df['engine_capacity'] = df['engine_capacity'].str.replace(' ', '')
-        df['engine_capacity'] = df['engine_capacity'].str.replace(',00', '')
+        # VALIDATE DATAFRAME - LEAVE ONLY REQUIRED COLUMNS
+        init_expected_columns = ["scrape_date","created_date","title","short_description",
+                                "price","currency","cepik_verified","make","fuel_type",
+                                "gearbox","country_origin","mileage","engine_capacity",
+                                "engine_power","model","year","version"]
+        columns_info = self._validate_dataframe(df,init_expected_columns)
+        if columns_info["missing_columns"]:
+            # numeric columns end up as -1 after the coercion below, the rest stay NaN
+            self.logger.info(f"Missing columns added: {columns_info['missing_columns']}")
+        # adds missing columns as NaN, drops extra ones and orders them in one step,
+        # before any cleanup so the steps below can rely on every expected column
+        df = df.reindex(columns=init_expected_columns)
+
+        # REMOVE space FROM STR LOOKLIKE INT (string dtype, the column is all-NaN float when missing)
+        df['engine_capacity'] = df['engine_capacity'].astype('string').str.replace(r' |,00', '', regex=True)
 
         # SET DTYPES PROPERLY
+        numeric_cols = ['price','mileage','engine_capacity','engine_power','year']
         col_dtype = {
             'price': 'int',
             'cepik_verified': 'bool',
@@ -387,23 +532,18 @@ class OtoMotoETL(ETLStrategy):
             'engine_capacity': 'int',
             'engine_power': 'int',
             'year': 'int'}
-        df[['price','mileage','engine_capacity','engine_power','year']] = df[['price','mileage','engine_capacity','engine_power','year']].fillna(-1)
+        # coerce all numeric columns in one pass, unparsable values end up as -1 like missing ones
+        df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(-1)
         df = df.astype(col_dtype)
-        df[['scrape_date', 'created_date']] = df[['scrape_date', 'created_date']].apply({
-            'scrape_date': pd.to_datetime,
-            'created_date': pd.to_datetime})
-        
-        # VALIDATE DATAFRAME - LEAVE ONLY REQUIRED COLUMNS
-        init_expected_columns = ["scrape_date","created_date","title","short_description",
-                                "price","currency","cepik_verified","make","fuel_type",
-                                "gearbox","country_origin","mileage","engine_capacity",
-                                "engine_power","model","year","version"]
-        columns_info = self._validate_dataframe(df,init_expected_columns)
-        if len(columns_info["missing_columns"]) == 0:
-            for col in columns_info["missing_columns"]:
-                df[col] = np.nan
-        if not columns_info['correct_order']:
-            df = df[init_expected_columns]
+        # every row of a run shares one scrape_date, cache=True parses it once
+        df['scrape_date'] = pd.to_datetime(df['scrape_date'], format='%Y-%m-%d', cache=True)
+        df['created_date'] = pd.to_datetime(df['created_date'], cache=True)
+
+        # STRINGS AS ARROW BUFFERS - no object->Arrow conversion in the Parquet load,
+        # and columns missing from the batch load as STRING instead of all-NaN FLOAT
+        text_cols = ['title','short_description','currency','make','fuel_type',
+                    'gearbox','country_origin','model','version']
+        df[text_cols] = df[text_cols].astype('string[pyarrow]')
 
         # RENAME COLUMNS
         mapper = {
@@ -419,14 +559,20 @@ class OtoMotoETL(ETLStrategy):
         assert how_add.upper()=='APPEND' or how_add.upper()=='TRUNCATE','Variable how_add can be only "append" or "truncate"'
         self.logger.info(f"Loading data.")
 
-        # Set up configuration to connect with BigQuery
-        job_config = bigquery.LoadJobConfig(
-            write_disposition=f"WRITE_{how_add}",  # Use 'WRITE_APPEND' if you want to append data
-            autodetect=True
-        )
-        # Upload the DataFrame to BigQuery
-        job = self.client.load_table_from_dataframe(df, self.table_ref, job_config=job_config)
-        job.result()
+        # Upload the DataFrame to BigQuery as Parquet, in chunks of LOAD_CHUNK_ROWS
+        write_disposition = f"WRITE_{how_add.upper()}"
+        for start in range(0, len(df), LOAD_CHUNK_ROWS):
+            # Set up configuration to connect with BigQuery
+            job_config = bigquery.LoadJobConfig(
+                write_disposition=write_disposition,
+                source_format=bigquery.SourceFormat.PARQUET,
+                autodetect=True
+            )
+            job = self.client.load_table_from_dataframe(df.iloc[start:start+LOAD_CHUNK_ROWS], self.table_ref, job_config=job_config)
+            job.result()
+
+            # Truncate only once, following chunks are appended
+            write_disposition = "WRITE_APPEND"
    
     def run_etl(self, **kwargs):
         '''
@@ -436,13 +582,20 @@ class OtoMotoETL(ETLStrategy):
             'model': str, e.g. astra
             'days_ago: int, how many days before wants to scrape
             'delay_scraping': bool, if true delay scraping every page by sleep(randint(1,5))
+            'max_workers': int, number of pages fetched concurrently, default MAX_WORKERS
             'how_add': str, append/truncate, if append add to existing Table, if truncate - drop rows and add to empty table
         '''
         # Prerequisites
-        kwargs['headers'] = self._get_headers()
+        self.session.headers.update(self._get_headers())
         url = self._get_url(kwargs['brand'], kwargs['model'])
-        soup = self._get_soup(url, kwargs['headers'])
-        num_page = self._find_page_num(str(soup))
+        content = self._get_page(url)
+        if content is None:
+            raise ValueError("Failed to fetch the first page.")
+        listings = self._get_next_data(content)
+        if not listings:
+            raise ValueError("No car listings found. The website structure may have changed.")
+        json_object = orjson.loads(listings)
+        num_page = self._find_page_num(self._get_advert_search(json_object))
         iters = ceil(num_page/100) 
         
         # Save results of scraping every 100 pages
@@ -454,9 +607,10 @@ class OtoMotoETL(ETLStrategy):
 
             # ETL process
             data, forced_stop = self.extarct(**kwargs)
-            transformed_data = self.transform(data)
-            how_add = kwargs.get('how_add', 'append')
-            # self.load(transformed_data,how_add=how_add)
+            if data is not None:
+                transformed_data = self.transform(data)
+                how_add = kwargs.get('how_add', 'append')
+                # self.load(transformed_data,how_add=how_add)
 
             if forced_stop:
                 return